@@ -10,6 +10,23 @@ from setuptools import setup, find_packages
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+# Compile the hot field-validation and key-handling modules with Cython
+# when it is available. These modules are dominated by simple type checks
+# and string ops which benefit from C-level dispatch. The package stays
+# pure Python when Cython is not installed.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [
+            'src/fireo/fields/reference_field.py',
+            'src/fireo/fields/nested_model_field.py',
+            'src/fireo/utils/utils.py',
+        ],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name='fireo',
 
@@ -63,6 +80,8 @@ setup(
 
     package_dir={'': 'src'},
 
+    ext_modules=ext_modules,
+
     # List run-time dependencies here.  These will be installed by pip when
     # your project is installed. For an analysis of "install_requires" vs pip's
     # requirements files see:
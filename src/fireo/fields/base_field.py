@@ -61,6 +61,11 @@ class Field(metaclass=MetaField):
     field_value(val):
         How this field represent value that is coming from firestore
     """
+    # Fields are created in large numbers at class definition time so keep
+    # instances dict free, subclasses which add instance attributes need to
+    # declare their own `__slots__`
+    __slots__ = ('raw_attributes', 'name', 'model_cls', 'field_attribute')
+
     allowed_attributes = []
 
     empty_value_attributes = []
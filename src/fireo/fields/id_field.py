@@ -20,6 +20,9 @@ class IDField(Field):
         # After save id will be saved in `user_id`
         print(self.user_id)  # custom_doc_id
     """
+
+    __slots__ = ()
+
     def contribute_to_model(self, model_cls, name):
         self.name = name
         setattr(model_cls, name, None)
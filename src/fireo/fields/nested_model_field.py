@@ -1,28 +1,66 @@
 from fireo.fields import errors
 from fireo.fields.base_field import Field
 
+# Model class resolved lazily, importing it at module level
+# create circular dependency
+_model = None
+
+
+def _model_cls():
+    """Resolve and cache the Model class on first use"""
+    global _model
+    if _model is None:
+        from fireo.models import Model
+        _model = Model
+    return _model
+
 
 class NestedModel(Field):
     """Model inside another model"""
 
+    __slots__ = ('nested_model', '_allowed')
+
     def __init__(self, model, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Check nested model class is subclass for Model
-        from fireo.models import Model
-        if not issubclass(model, Model):
+        if not issubclass(model, _model_cls()):
             raise errors.NestedModelTypeError(f'Nested model "{model.__name__}" must be inherit from Model class')
         self.nested_model = model
+        # Nested model and its registered subclasses, validation is a
+        # set membership test instead of a subclass walk
+        self._allowed = self._allowed_models()
+
+    def _allowed_models(self):
+        """Collect nested model and all its registered subclasses"""
+        allowed = {self.nested_model}
+        pending = self.nested_model.__subclasses__()
+        while pending:
+            model = pending.pop()
+            allowed.add(model)
+            pending.extend(model.__subclasses__())
+        return frozenset(allowed)
 
     def valid_model(self, model_instance):
-        """Check nested model and passing model is same"""
+        """Check nested model and passing model is same or its subclass"""
 
         # return False if no Nested model apply
         if model_instance is None:
             return False
 
-        if self.nested_model == model_instance.__class__:
+        # exact type match is the common case
+        cls = model_instance.__class__
+        if cls is self.nested_model or cls in self._allowed:
             return True
+
+        # subclasses can be registered after the field was built
+        # so refresh the allowed set once before giving up
+        self._allowed = self._allowed_models()
+        if cls in self._allowed:
+            return True
+        self._raise_mismatch(cls)
+
+    def _raise_mismatch(self, cls):
+        """Build the type error outside the hot validation path"""
         raise errors.NestedModelTypeError(f'Invalid nested model type. Field "{self.name}" required value type '
-                                          f'"{self.nested_model.__name__}", but got '
-                                          f'"{model_instance.__class__.__name__}"')
+                                          f'"{self.nested_model.__name__}", but got "{cls.__name__}"')
 
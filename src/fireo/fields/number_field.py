@@ -17,6 +17,8 @@ class NumberField(Field):
             age = NumberField()
     """
 
+    __slots__ = ()
+
     allowed_attributes = ['int_only', 'float_only', 'range']
 
     def attr_range(self, attr_val, field_val):
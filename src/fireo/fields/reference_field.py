@@ -1,9 +1,44 @@
+import functools
+from weakref import WeakValueDictionary
+
 from fireo.database import db
 from fireo.fields import errors
 from fireo.fields.base_field import Field
 from fireo.utils import utils
 from google.cloud import firestore
 
+# Reuse document reference objects for models which are referenced
+# multiple times for example in nested and batch writes
+_REF_CACHE = WeakValueDictionary()
+
+# Model class resolved lazily, importing it at module level
+# create circular dependency
+_model = None
+
+
+def _model_cls():
+    """Resolve and cache the Model class on first use"""
+    global _model
+    if _model is None:
+        from fireo.models import Model
+        _model = Model
+    return _model
+
+
+# DocumentReference constructor with the connection client already bound,
+# built lazily because db.conn may not exist at import time
+_make_ref = None
+_make_ref_client = None
+
+
+def _ref_factory(conn):
+    """DocumentReference constructor with the client bound once"""
+    global _make_ref, _make_ref_client
+    if _make_ref_client is not conn:
+        _make_ref = functools.partial(firestore.DocumentReference, client=conn)
+        _make_ref_client = conn
+    return _make_ref
+
 
 class ReferenceField(Field):
     """Reference of other model
@@ -40,6 +75,8 @@ class ReferenceField(Field):
         If given type is not supported by attribute
     """
 
+    __slots__ = ('model_ref', 'auto_load', 'on_load', '_on_load_fn', '_ref_subclass_cache')
+
     allowed_attributes = ['auto_load', 'on_load']
 
     empty_value_attributes = allowed_attributes
@@ -47,16 +84,23 @@ class ReferenceField(Field):
     def __init__(self, model_ref, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Check model ref class is subclass for Model
-        from fireo.models import Model
-        if not issubclass(model_ref, Model):
+        if not issubclass(model_ref, _model_cls()):
             raise errors.ReferenceTypeError(f'Reference model "{model_ref.__name__}" must be inherit from Model class')
         self.model_ref = model_ref
         self.auto_load = True
         self.on_load = None
+        self._on_load_fn = None
+        # Subclasses of `model_ref` that already passed the `issubclass` check
+        # so next writes can skip the MRO walk
+        self._ref_subclass_cache = set()
 
     # Override method
     def field_value(self, val):
-        v = self.field_attribute.parse(val)
+        # field_value only runs for values coming back from firestore which
+        # were already validated when they were written, so apply just the
+        # reference attributes (auto_load, on_load) and skip the required,
+        # default and validator checks
+        v = self.field_attribute.parse(val, run_only=self.allowed_attributes)
         return v
 
     # Override method
@@ -65,35 +109,62 @@ class ReferenceField(Field):
         if model is None:
             return None
         # check reference model and passing model is same
-        if not issubclass(model.__class__, self.model_ref):
-            raise errors.ReferenceTypeError(f'Invalid reference type. Field "{self.name}" required value type '
-                                            f'"{self.model_ref.__name__}", but got "{model.__class__.__name__}"')
+        # exact type match is the common case and skip the `issubclass` MRO walk
+        cls = type(model)
+        model_ref = self.model_ref
+        if cls is not model_ref and cls not in self._ref_subclass_cache:
+            if not issubclass(cls, model_ref):
+                self._raise_mismatch(cls)
+            self._ref_subclass_cache.add(cls)
         # Get document reference from firestore
-        return firestore.DocumentReference(*utils.ref_path(model.key), client=db.conn)
-
-    def attr_auto_load(self, attr_val, field_val):
+        key = model.key
+        conn = db.conn
+        ref = _REF_CACHE.get(key)
+        if ref is None or ref._client is not conn:
+            # reference path is precomputed when the model key is set
+            path = model._ref_path or utils.ref_path(key)
+            ref = _ref_factory(conn)(*path)
+            _REF_CACHE[key] = ref
+        return ref
+
+    def _raise_mismatch(self, cls):
+        """Build the type error outside the hot validation path"""
+        raise errors.ReferenceTypeError(f'Invalid reference type. Field "{self.name}" required value type '
+                                        f'"{self.model_ref.__name__}", but got "{cls.__name__}"')
+
+    def attr_auto_load(self, attr_val, field_val, _bool=bool):
         """Attribute method for auto load
 
         Allow users to load reference documents automatically or just return the reference
         and user itself call the `get()` method to load the document.
+
+        `bool` is bound as default arg so the check resolves it as a local
+        instead of a global lookup on every call
         """
-        if type(attr_val) is not bool:
-            raise errors.AttributeTypeError(f'Attribute auto_load only accept bool type, got {type(attr_val)} in '
+        if attr_val.__class__ is not _bool:
+            raise errors.AttributeTypeError(f'Attribute auto_load only accept bool type, '
+                                            f'got {attr_val.__class__.__name__} in '
                                             f'model "{self.model_cls.__name__}" field "{self.name}"')
         self.auto_load = attr_val
         return field_val
 
-    def attr_on_load(self, method_name, field_val):
+    def attr_on_load(self, method_name, field_val, _getattr=getattr, _callable=callable):
         """Attribute method for on load
 
         Call user specify method when reference document is loaded
+
+        `getattr` and `callable` are bound as default args so they resolve
+        as locals instead of global lookups on every call
         """
         try:
-            m = getattr(self.model_cls, method_name)
-            if not callable(m):
+            m = _getattr(self.model_cls, method_name)
+            if not _callable(m):
                 raise errors.AttributeTypeError(f'Attribute {m} is not callable in model "{self.model_cls.__name__}" '
                                                 f'field "{self.name}"')
             self.on_load = method_name
+            # keep the resolved function so callers don't need to look
+            # it up by name again for every loaded document
+            self._on_load_fn = m
         except AttributeError as e:
             raise errors.AttributeMethodNotDefined(f'Method "{method_name}" is not defined for attribute on_load in '
                                                    f'model "{self.model_cls.__name__}" field "{self.name}"') from e
@@ -18,6 +18,8 @@ class TextField(Field):
             age = TextField()
     """
 
+    __slots__ = ('format_type', 'supported_types')
+
     allowed_attributes = ['max_length', 'to_lowercase', 'format']
 
     def __init__(self, *args, **kwargs):
@@ -99,6 +99,10 @@ class Model(metaclass=ModelMeta):
     # current document id and collection name and parent if any
     _key = None
 
+    # Reference path tuple computed along with the key so reference
+    # fields don't need to split the key on every write
+    _ref_path = None
+
     # For sub collection there must be a parent
     parent = ""
 
@@ -286,6 +290,7 @@ class Model(metaclass=ModelMeta):
             self._key = p[1:]
         else:
             self._key = p
+        self._ref_path = utils.ref_path(self._key)
 
     def get_firestore_create_time(self):
         """returns create time of document in Firestore
@@ -1,8 +1,13 @@
 import base64
+import collections
 import json
 import itertools
 from fireo.queries import query_wrapper
 
+# How many documents are wrapped together so their reference
+# docs can be loaded with one `get_all()` round trip
+REF_BATCH_SIZE = 20
+
 
 class QueryIterator:
     """Iterator the documents coming from Firestore
@@ -10,6 +15,10 @@ class QueryIterator:
     Iterate each document that is coming from Firestore and wrap it to the model
     QueryIterator also contain the other information for example Firestore query, cursor etc
 
+    Documents are wrapped in small batches so that reference fields with
+    `auto_load` are resolved with one multi get per batch instead of one
+    `get()` call per reference
+
     Methods
     -------
     fetch_next():
@@ -27,21 +36,18 @@ class QueryIterator:
         self.last_doc = None
         self.last_doc_key = None
         self.fetch_end = False
+        # Models already wrapped and waiting to be returned
+        self.model_batch = collections.deque()
 
     def __iter__(self):
         return self
 
     def __next__(self):
         try:
-            doc = next(self.docs, None)
-            if doc:
-                # Suppose this is the last doc
-                self.last_doc = doc
-                m = query_wrapper.ModelWrapper.from_query_result(self.model_cls(), doc)
-                m._update_doc = self.query._update_doc_key(m)
-                # Suppose this is last doc
-                self.last_doc_key = m.key
-                return m
+            if not self.model_batch:
+                self._wrap_batch()
+            if self.model_batch:
+                return self.model_batch.popleft()
             self.fetch_end = True
             # Save last doc key in cursor
             self.query.cursor_dict['last_doc_key'] = self.last_doc_key
@@ -49,6 +55,21 @@ class QueryIterator:
         except StopIteration:
             raise StopIteration
 
+    def _wrap_batch(self):
+        """Wrap next batch of documents and resolve their reference docs together"""
+        deferred_refs = []
+        for doc in itertools.islice(self.docs, REF_BATCH_SIZE):
+            # Suppose this is the last doc
+            self.last_doc = doc
+            m = query_wrapper.ModelWrapper.from_query_result(self.model_cls(), doc, deferred_refs=deferred_refs)
+            m._update_doc = self.query._update_doc_key(m)
+            # Suppose this is last doc
+            self.last_doc_key = m.key
+            self.model_batch.append(m)
+        # Load all reference docs for this batch in one round trip
+        if deferred_refs:
+            query_wrapper.ReferenceDocLoader.resolve_all(deferred_refs)
+
     def next_fetch(self, limit=None):
         """Fetch next results"""
 
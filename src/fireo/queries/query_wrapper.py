@@ -1,3 +1,4 @@
+from fireo.database import db
 from fireo.fields import ReferenceField, NestedModel, IDField
 from fireo.queries import errors
 from fireo.utils import utils
@@ -7,7 +8,7 @@ from google.cloud import firestore
 class ModelWrapper:
     """Convert query result into Model instance"""
     @classmethod
-    def from_query_result(cls, model, doc, nested_doc=False):
+    def from_query_result(cls, model, doc, nested_doc=False, deferred_refs=None):
         parent_key = None
         if nested_doc:
             doc_dict = doc
@@ -32,7 +33,7 @@ class ModelWrapper:
                 continue
             # Check if it is Reference field
             if isinstance(field, ReferenceField):
-                val = ReferenceFieldWrapper.from_doc_ref(model, field, field.field_value(v))
+                val = ReferenceFieldWrapper.from_doc_ref(model, field, field.field_value(v), deferred_refs)
             elif isinstance(field, NestedModel):
                 nested_doc_val = field.field_value(v)
                 if nested_doc_val:
@@ -79,15 +80,22 @@ class ReferenceFieldWrapper:
 
     If auto_load is True then load the document otherwise return `ReferenceDocLoader` object and later user can use
     `get()` method to retrieve the document
+
+    When a `deferred_refs` list is given the auto load is not performed right away, the
+    loader is queued instead so that the caller can resolve all reference docs
+    with one `get_all()` round trip
     """
     @classmethod
-    def from_doc_ref(cls, parent_model, field, ref):
+    def from_doc_ref(cls, parent_model, field, ref, deferred_refs=None):
         if not ref:
             return None
 
         ref_doc = ReferenceDocLoader(parent_model, field, ref)
 
         if field.auto_load:
+            if deferred_refs is not None:
+                deferred_refs.append(ref_doc)
+                return ref_doc
             return ref_doc.get()
         return ref_doc
 
@@ -101,12 +109,34 @@ class ReferenceDocLoader:
 
     def get(self):
         doc = self.ref.get()
+        return self._wrap(doc)
+
+    def _wrap(self, doc):
+        """Convert fetched doc into model instance and run `on_load` if defined"""
         if not doc.exists:
             raise errors.ReferenceDocNotExist(f'{self.field.model_ref.collection_name}/{self.ref.id} not exist')
         model = ModelWrapper.from_query_result(self.field.model_ref(), doc)
 
         # if on_load method is defined then call it
         if self.field.on_load:
-            method_name = self.field.on_load
-            getattr(self.parent_model, method_name)(model)
+            # field keeps the resolved function so the name lookup
+            # is not repeated for every loaded document
+            on_load_fn = getattr(self.field, '_on_load_fn', None)
+            if on_load_fn is not None:
+                on_load_fn(self.parent_model, model)
+            else:
+                getattr(self.parent_model, self.field.on_load)(model)
         return model
+
+    @classmethod
+    def resolve_all(cls, loaders):
+        """Resolve queued reference docs with a single `get_all()` call
+
+        Loading each reference doc separately costs one round trip per
+        reference. Fetch all of them in one multi get and attach the
+        resulting model instances back to their parent models.
+        """
+        docs = {doc.reference.path: doc for doc in db.conn.get_all([loader.ref for loader in loaders])}
+        for loader in loaders:
+            model = loader._wrap(docs[loader.ref.path])
+            setattr(loader.parent_model, loader.field.name, model)
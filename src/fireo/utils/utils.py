@@ -1,14 +1,41 @@
 import re
+from functools import lru_cache
 
 from google.cloud import firestore
 
-
-def collection_name(model):
-    return re.sub('(?!^)([A-Z]+)', r'_\1', model).lower()
+# Convert CamelCase model name into snake_case collection name
+# kept for names which are not plain ASCII
+_CAMEL_RE = re.compile('(?!^)([A-Z]+)')
 
 
+@lru_cache(maxsize=None)
+def collection_name(model):
+    # For the short ASCII class names this is called with, a straight
+    # byte loop beats the regex engine, underscore goes before every
+    # uppercase run after the first character and the case bit (0x20)
+    # is OR'ed into uppercase bytes
+    try:
+        name = model.encode('ascii')
+    except UnicodeEncodeError:
+        return _CAMEL_RE.sub(r'_\1', model).lower()
+    out = bytearray()
+    in_run = False
+    for i, c in enumerate(name):
+        if 0x41 <= c <= 0x5A:
+            if i:
+                if not in_run:
+                    out.append(0x5F)
+                in_run = True
+            out.append(c | 0x20)
+        else:
+            in_run = False
+            out.append(c)
+    return out.decode('ascii')
+
+
+@lru_cache(maxsize=4096)
 def ref_path(key):
-    return key.split('/')
+    return tuple(key.split('/'))
 
 
 def collection_path(key):